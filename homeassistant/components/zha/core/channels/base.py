@@ -29,14 +29,16 @@ _LOGGER = logging.getLogger(__name__)
 
 def parse_and_log_command(channel, tsn, command_id, args):
     """Parse and log a zigbee cluster command."""
-    cmd = channel.cluster.server_commands.get(command_id, [command_id])[0]
-    channel.debug(
-        "received '%s' command with %s args on cluster_id '%s' tsn '%s'",
-        cmd,
-        args,
-        channel.cluster.cluster_id,
-        tsn,
-    )
+    cmd = channel.cluster.server_commands.get(command_id)
+    cmd = command_id if cmd is None else cmd[0]
+    if channel.debug_enabled:
+        channel.debug(
+            "received '%s' command with %s args on cluster_id '%s' tsn '%s'",
+            cmd,
+            args,
+            channel.cluster.cluster_id,
+            tsn,
+        )
     return cmd
 
 
@@ -133,6 +135,11 @@ class ZigbeeChannel(LogMixin):
         """Return the status of the channel."""
         return self._status
 
+    @property
+    def debug_enabled(self) -> bool:
+        """Return True if debug messages of this channel are logged."""
+        return _LOGGER.isEnabledFor(logging.DEBUG)
+
     @callback
     def async_send_signal(self, signal: str, *args: Any) -> None:
         """Send a signal through hass dispatcher."""
@@ -1,13 +1,13 @@
 """General channels module for Zigbee Home Automation."""
 import asyncio
+import functools
 import logging
-from typing import Any, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Type
 
 import zigpy.exceptions
 import zigpy.zcl.clusters.general as general
 
 from homeassistant.core import callback
-from homeassistant.helpers.event import async_call_later
 
 from .. import registries, typing as zha_typing
 from ..const import (
@@ -25,6 +25,28 @@ from .base import ClientChannel, ZigbeeChannel, parse_and_log_command
 
 _LOGGER = logging.getLogger(__name__)
 
+_PRESENT_VALUE_REPORT_CONFIG = (
+    {"attr": "present_value", "config": REPORT_CONFIG_DEFAULT},
+)
+
+_LC_SET_LEVEL_CMDS = frozenset({"move_to_level", "move_to_level_with_on_off"})
+_LC_MOVE_CMDS = frozenset({"move", "move_with_on_off"})
+_LC_STEP_CMDS = frozenset({"step", "step_with_on_off"})
+_ONOFF_OFF_CMDS = frozenset({"off", "off_with_effect"})
+_ONOFF_ON_CMDS = frozenset({"on", "on_with_recall_global_scene"})
+
+
+@functools.lru_cache(maxsize=None)
+def _command_names(
+    cluster_type: Type[zha_typing.ZigpyClusterType], client: bool
+) -> Dict[int, str]:
+    """Return the command id to name map shared by all clusters of a type."""
+    if client:
+        commands = cluster_type.client_commands
+    else:
+        commands = cluster_type.server_commands
+    return {cmd_id: cmd[0] for cmd_id, cmd in commands.items()}
+
 
 @registries.ZIGBEE_CHANNEL_REGISTRY.register(general.Alarms.cluster_id)
 class Alarms(ZigbeeChannel):
@@ -35,21 +57,21 @@ class Alarms(ZigbeeChannel):
 class AnalogInput(ZigbeeChannel):
     """Analog Input channel."""
 
-    REPORT_CONFIG = [{"attr": "present_value", "config": REPORT_CONFIG_DEFAULT}]
+    REPORT_CONFIG = _PRESENT_VALUE_REPORT_CONFIG
 
 
 @registries.ZIGBEE_CHANNEL_REGISTRY.register(general.AnalogOutput.cluster_id)
 class AnalogOutput(ZigbeeChannel):
     """Analog Output channel."""
 
-    REPORT_CONFIG = [{"attr": "present_value", "config": REPORT_CONFIG_DEFAULT}]
+    REPORT_CONFIG = _PRESENT_VALUE_REPORT_CONFIG
 
 
 @registries.ZIGBEE_CHANNEL_REGISTRY.register(general.AnalogValue.cluster_id)
 class AnalogValue(ZigbeeChannel):
     """Analog Value channel."""
 
-    REPORT_CONFIG = [{"attr": "present_value", "config": REPORT_CONFIG_DEFAULT}]
+    REPORT_CONFIG = _PRESENT_VALUE_REPORT_CONFIG
 
 
 @registries.ZIGBEE_CHANNEL_REGISTRY.register(general.ApplianceControl.cluster_id)
@@ -105,21 +127,21 @@ class BasicChannel(ZigbeeChannel):
 class BinaryInput(ZigbeeChannel):
     """Binary Input channel."""
 
-    REPORT_CONFIG = [{"attr": "present_value", "config": REPORT_CONFIG_DEFAULT}]
+    REPORT_CONFIG = _PRESENT_VALUE_REPORT_CONFIG
 
 
 @registries.ZIGBEE_CHANNEL_REGISTRY.register(general.BinaryOutput.cluster_id)
 class BinaryOutput(ZigbeeChannel):
     """Binary Output channel."""
 
-    REPORT_CONFIG = [{"attr": "present_value", "config": REPORT_CONFIG_DEFAULT}]
+    REPORT_CONFIG = _PRESENT_VALUE_REPORT_CONFIG
 
 
 @registries.ZIGBEE_CHANNEL_REGISTRY.register(general.BinaryValue.cluster_id)
 class BinaryValue(ZigbeeChannel):
     """Binary Value channel."""
 
-    REPORT_CONFIG = [{"attr": "present_value", "config": REPORT_CONFIG_DEFAULT}]
+    REPORT_CONFIG = _PRESENT_VALUE_REPORT_CONFIG
 
 
 @registries.ZIGBEE_CHANNEL_REGISTRY.register(general.Commissioning.cluster_id)
@@ -146,13 +168,20 @@ class Groups(ZigbeeChannel):
 class Identify(ZigbeeChannel):
     """Identify channel."""
 
+    def __init__(
+        self, cluster: zha_typing.ZigpyClusterType, ch_pool: zha_typing.ChannelPoolType
+    ) -> None:
+        """Initialize Identify channel."""
+        super().__init__(cluster, ch_pool)
+        self._signal_trigger_effect = f"{self.unique_id}_trigger_effect"
+
     @callback
     def cluster_command(self, tsn, command_id, args):
         """Handle commands received to this cluster."""
         cmd = parse_and_log_command(self, tsn, command_id, args)
 
         if cmd == "trigger_effect":
-            self.async_send_signal(f"{self.unique_id}_{cmd}", args[0])
+            self.async_send_signal(self._signal_trigger_effect, args[0])
 
 
 @registries.CLIENT_CHANNELS_REGISTRY.register(general.LevelControl.cluster_id)
@@ -169,61 +198,112 @@ class LevelControlChannel(ZigbeeChannel):
     CURRENT_LEVEL = 0
     REPORT_CONFIG = ({"attr": "current_level", "config": REPORT_CONFIG_ASAP},)
 
+    def __init__(
+        self, cluster: zha_typing.ZigpyClusterType, ch_pool: zha_typing.ChannelPoolType
+    ) -> None:
+        """Initialize LevelControlChannel."""
+        super().__init__(cluster, ch_pool)
+        self._level_signals = {
+            SIGNAL_MOVE_LEVEL: f"{self.unique_id}_{SIGNAL_MOVE_LEVEL}",
+            SIGNAL_SET_LEVEL: f"{self.unique_id}_{SIGNAL_SET_LEVEL}",
+        }
+        self._level_listeners = {}
+
     @callback
     def cluster_command(self, tsn, command_id, args):
         """Handle commands received to this cluster."""
         cmd = parse_and_log_command(self, tsn, command_id, args)
-
-        if cmd in ("move_to_level", "move_to_level_with_on_off"):
-            self.dispatch_level_change(SIGNAL_SET_LEVEL, args[0])
-        elif cmd in ("move", "move_with_on_off"):
-            # We should dim slowly -- for now, just step once
-            rate = args[1]
-            if args[0] == 0xFF:
-                rate = 10  # Should read default move rate
-            self.dispatch_level_change(SIGNAL_MOVE_LEVEL, -rate if args[0] else rate)
-        elif cmd in ("step", "step_with_on_off"):
-            # Step (technically may change on/off)
-            self.dispatch_level_change(
-                SIGNAL_MOVE_LEVEL, -args[1] if args[0] else args[1]
-            )
+        handler = self._COMMAND_HANDLERS.get(cmd)
+        if handler is not None:
+            handler(self, args)
+
+    def _handle_move_to_level(self, args):
+        """Handle move_to_level commands."""
+        self.dispatch_level_change(SIGNAL_SET_LEVEL, args[0])
+
+    def _handle_move(self, args):
+        """Handle move commands."""
+        # We should dim slowly -- for now, just step once
+        rate = args[1]
+        if args[0] == 0xFF:
+            rate = 10  # Should read default move rate
+        self.dispatch_level_change(SIGNAL_MOVE_LEVEL, -rate if args[0] else rate)
+
+    def _handle_step(self, args):
+        """Handle step commands."""
+        # Step (technically may change on/off)
+        self.dispatch_level_change(SIGNAL_MOVE_LEVEL, -args[1] if args[0] else args[1])
+
+    _COMMAND_HANDLERS = {
+        **dict.fromkeys(_LC_SET_LEVEL_CMDS, _handle_move_to_level),
+        **dict.fromkeys(_LC_MOVE_CMDS, _handle_move),
+        **dict.fromkeys(_LC_STEP_CMDS, _handle_step),
+    }
 
     @callback
     def attribute_updated(self, attrid, value):
         """Handle attribute updates on this cluster."""
-        self.debug("received attribute: %s update with value: %s", attrid, value)
+        if self.debug_enabled:
+            self.debug("received attribute: %s update with value: %s", attrid, value)
         if attrid == self.CURRENT_LEVEL:
             self.dispatch_level_change(SIGNAL_SET_LEVEL, value)
 
+    @callback
+    def register_level_listener(
+        self, command: str, listener: Callable[[int], None]
+    ) -> Callable[[], None]:
+        """Register a listener called directly for level changes.
+
+        While a listener is registered, level changes of this command are no
+        longer sent as a dispatcher signal, so entities subscribed to that
+        signal stop receiving them. Only one listener per command is kept; a
+        second registration replaces the first. Returns a function to
+        unregister the listener.
+        """
+        if command in self._level_listeners:
+            self.warning(
+                "replacing the registered %s listener %s with %s",
+                command,
+                self._level_listeners[command],
+                listener,
+            )
+        self._level_listeners[command] = listener
+
+        @callback
+        def remove_listener() -> None:
+            if self._level_listeners.get(command) is listener:
+                del self._level_listeners[command]
+
+        return remove_listener
+
     def dispatch_level_change(self, command, level):
         """Dispatch level change."""
-        self.async_send_signal(f"{self.unique_id}_{command}", level)
-
-    async def async_initialize(self, from_cache):
-        """Initialize channel."""
-        await self.get_attribute_value(self.CURRENT_LEVEL, from_cache=from_cache)
-        await super().async_initialize(from_cache)
+        listener = self._level_listeners.get(command)
+        if listener is not None:
+            listener(level)
+            return
+        self.async_send_signal(self._level_signals[command], level)
 
 
 @registries.ZIGBEE_CHANNEL_REGISTRY.register(general.MultistateInput.cluster_id)
 class MultistateInput(ZigbeeChannel):
     """Multistate Input channel."""
 
-    REPORT_CONFIG = [{"attr": "present_value", "config": REPORT_CONFIG_DEFAULT}]
+    REPORT_CONFIG = _PRESENT_VALUE_REPORT_CONFIG
 
 
 @registries.ZIGBEE_CHANNEL_REGISTRY.register(general.MultistateOutput.cluster_id)
 class MultistateOutput(ZigbeeChannel):
     """Multistate Output channel."""
 
-    REPORT_CONFIG = [{"attr": "present_value", "config": REPORT_CONFIG_DEFAULT}]
+    REPORT_CONFIG = _PRESENT_VALUE_REPORT_CONFIG
 
 
 @registries.ZIGBEE_CHANNEL_REGISTRY.register(general.MultistateValue.cluster_id)
 class MultistateValue(ZigbeeChannel):
     """Multistate Value channel."""
 
-    REPORT_CONFIG = [{"attr": "present_value", "config": REPORT_CONFIG_DEFAULT}]
+    REPORT_CONFIG = _PRESENT_VALUE_REPORT_CONFIG
 
 
 @registries.CLIENT_CHANNELS_REGISTRY.register(general.OnOff.cluster_id)
@@ -240,6 +320,7 @@ class OnOffChannel(ZigbeeChannel):
     """Channel for the OnOff Zigbee cluster."""
 
     ON_OFF = 0
+    OFF_DEADLINE_TOLERANCE = 0.05  # 50ms
     REPORT_CONFIG = ({"attr": "on_off", "config": REPORT_CONFIG_IMMEDIATE},)
 
     def __init__(
@@ -249,48 +330,73 @@ class OnOffChannel(ZigbeeChannel):
         super().__init__(cluster, ch_pool)
         self._state = None
         self._off_listener = None
+        self._off_deadline = None
+        self._signal_attr_updated = f"{self.unique_id}_{SIGNAL_ATTR_UPDATED}"
 
     @callback
     def cluster_command(self, tsn, command_id, args):
         """Handle commands received to this cluster."""
         cmd = parse_and_log_command(self, tsn, command_id, args)
+        handler = self._COMMAND_HANDLERS.get(cmd)
+        if handler is not None:
+            handler(self, args)
+
+    def _handle_off(self, args):
+        """Handle off commands."""
+        self.attribute_updated(self.ON_OFF, False)
 
-        if cmd in ("off", "off_with_effect"):
-            self.attribute_updated(self.ON_OFF, False)
-        elif cmd in ("on", "on_with_recall_global_scene"):
+    def _handle_on(self, args):
+        """Handle on commands."""
+        self.attribute_updated(self.ON_OFF, True)
+
+    def _handle_on_with_timed_off(self, args):
+        """Handle on_with_timed_off command."""
+        should_accept = args[0]
+        on_time = args[1]
+        # 0 is always accept 1 is only accept when already on
+        if should_accept == 0 or (should_accept == 1 and self._state):
             self.attribute_updated(self.ON_OFF, True)
-        elif cmd == "on_with_timed_off":
-            should_accept = args[0]
-            on_time = args[1]
-            # 0 is always accept 1 is only accept when already on
-            if should_accept == 0 or (should_accept == 1 and self._state):
+            if on_time > 0:
+                loop = self._ch_pool.hass.loop
+                delay = on_time / 10  # value is in 10ths of a second
+                deadline = loop.time() + delay
                 if self._off_listener is not None:
-                    self._off_listener()
-                    self._off_listener = None
-                self.attribute_updated(self.ON_OFF, True)
-                if on_time > 0:
-                    self._off_listener = async_call_later(
-                        self._ch_pool.hass,
-                        (on_time / 10),  # value is in 10ths of a second
-                        self.set_to_off,
-                    )
-        elif cmd == "toggle":
-            self.attribute_updated(self.ON_OFF, not bool(self._state))
+                    drift = abs(deadline - self._off_deadline)
+                    if drift < self.OFF_DEADLINE_TOLERANCE:
+                        return
+                    self._off_listener.cancel()
+                self._off_listener = loop.call_later(delay, self.set_to_off)
+                self._off_deadline = deadline
+            elif self._off_listener is not None:
+                self._off_listener.cancel()
+                self._off_listener = None
+                self._off_deadline = None
+
+    def _handle_toggle(self, args):
+        """Handle toggle command."""
+        self.attribute_updated(self.ON_OFF, not bool(self._state))
+
+    _COMMAND_HANDLERS = {
+        **dict.fromkeys(_ONOFF_OFF_CMDS, _handle_off),
+        **dict.fromkeys(_ONOFF_ON_CMDS, _handle_on),
+        "on_with_timed_off": _handle_on_with_timed_off,
+        "toggle": _handle_toggle,
+    }
 
     @callback
     def set_to_off(self, *_):
         """Set the state to off."""
         self._off_listener = None
+        self._off_deadline = None
         self.attribute_updated(self.ON_OFF, False)
 
     @callback
     def attribute_updated(self, attrid, value):
         """Handle attribute updates on this cluster."""
         if attrid == self.ON_OFF:
-            self.async_send_signal(
-                f"{self.unique_id}_{SIGNAL_ATTR_UPDATED}", attrid, "on_off", value
-            )
-            self._state = bool(value)
+            state = bool(value)
+            self.async_send_signal(self._signal_attr_updated, attrid, "on_off", state)
+            self._state = state
 
     async def async_initialize(self, from_cache):
         """Initialize channel."""
@@ -304,7 +410,8 @@ class OnOffChannel(ZigbeeChannel):
         if self.cluster.is_client:
             return
         from_cache = not self._ch_pool.is_mains_powered
-        self.debug("attempting to update onoff state - from cache: %s", from_cache)
+        if self.debug_enabled:
+            self.debug("attempting to update onoff state - from cache: %s", from_cache)
         state = await self.get_attribute_value(self.ON_OFF, from_cache=from_cache)
         if state is not None:
             self._state = bool(state)
@@ -321,15 +428,23 @@ class OnOffConfiguration(ZigbeeChannel):
 class Ota(ZigbeeChannel):
     """OTA Channel."""
 
+    def __init__(
+        self, cluster: zha_typing.ZigpyClusterType, ch_pool: zha_typing.ChannelPoolType
+    ) -> None:
+        """Initialize Ota channel."""
+        super().__init__(cluster, ch_pool)
+        self._server_cmd_names = _command_names(type(self.cluster), False)
+        signal_id = self._ch_pool.unique_id.split("-", 1)[0]
+        self._signal_update_device = SIGNAL_UPDATE_DEVICE.format(signal_id)
+
     @callback
     def cluster_command(
         self, tsn: int, command_id: int, args: Optional[List[Any]]
     ) -> None:
         """Handle OTA commands."""
-        cmd_name = self.cluster.server_commands.get(command_id, [command_id])[0]
-        signal_id = self._ch_pool.unique_id.split("-")[0]
+        cmd_name = self._server_cmd_names.get(command_id, command_id)
         if cmd_name == "query_next_image":
-            self.async_send_signal(SIGNAL_UPDATE_DEVICE.format(signal_id), args[3])
+            self.async_send_signal(self._signal_update_device, args[3])
 
 
 @registries.ZIGBEE_CHANNEL_REGISTRY.register(general.Partition.cluster_id)
@@ -346,13 +461,26 @@ class PollControl(ZigbeeChannel):
     CHECKIN_FAST_POLL_TIMEOUT = 2 * 4  # 2s
     LONG_POLL = 6 * 4  # 6s
 
+    def __init__(
+        self, cluster: zha_typing.ZigpyClusterType, ch_pool: zha_typing.ChannelPoolType
+    ) -> None:
+        """Initialize PollControl channel."""
+        super().__init__(cluster, ch_pool)
+        self._client_cmd_names = _command_names(type(self.cluster), True)
+
     async def async_configure(self) -> None:
         """Configure channel: set check-in interval."""
+        if self.cluster.get("checkin_interval") == self.CHECKIN_INTERVAL:
+            await super().async_configure()
+            return
         try:
             res = await self.cluster.write_attributes(
                 {"checkin_interval": self.CHECKIN_INTERVAL}
             )
-            self.debug("%ss check-in interval set: %s", self.CHECKIN_INTERVAL / 4, res)
+            if self.debug_enabled:
+                self.debug(
+                    "%ss check-in interval set: %s", self.CHECKIN_INTERVAL / 4, res
+                )
         except (asyncio.TimeoutError, zigpy.exceptions.ZigbeeException) as ex:
             self.debug("Couldn't set check-in interval: %s", ex)
         await super().async_configure()
@@ -362,7 +490,7 @@ class PollControl(ZigbeeChannel):
         self, tsn: int, command_id: int, args: Optional[List[Any]]
     ) -> None:
         """Handle commands received to this cluster."""
-        cmd_name = self.cluster.client_commands.get(command_id, [command_id])[0]
+        cmd_name = self._client_cmd_names.get(command_id, command_id)
         self.debug("Received %s tsn command '%s': %s", tsn, cmd_name, args)
         self.zha_send_event(cmd_name, args)
         if cmd_name == "checkin":
@@ -384,31 +512,43 @@ class PowerConfigurationChannel(ZigbeeChannel):
         {"attr": "battery_percentage_remaining", "config": REPORT_CONFIG_BATTERY_SAVE},
     )
 
-    @callback
-    def attribute_updated(self, attrid, value):
-        """Handle attribute updates on this cluster."""
+    def __init__(
+        self, cluster: zha_typing.ZigpyClusterType, ch_pool: zha_typing.ChannelPoolType
+    ) -> None:
+        """Initialize PowerConfigurationChannel."""
+        super().__init__(cluster, ch_pool)
+        self._signal_attr_updated = f"{self.unique_id}_{SIGNAL_ATTR_UPDATED}"
+        self._signal_state_attr = f"{self.unique_id}_{SIGNAL_STATE_ATTR}"
         attr = self._report_config[1].get("attr")
         if isinstance(attr, str):
-            attr_id = self.cluster.attridx.get(attr)
+            self._battery_percentage_attr_id = self.cluster.attridx.get(attr)
         else:
-            attr_id = attr
-        if attrid == attr_id:
+            self._battery_percentage_attr_id = attr
+        self._attr_names = {}
+
+    def _attr_name(self, attrid):
+        """Return the memoized name of an attribute id."""
+        name = self._attr_names.get(attrid)
+        if name is None:
+            attr = self.cluster.attributes.get(attrid)
+            name = self._attr_names[attrid] = attr[0] if attr else attrid
+        return name
+
+    @callback
+    def attribute_updated(self, attrid, value):
+        """Handle attribute updates on this cluster."""
+        if attrid == self._battery_percentage_attr_id:
             self.async_send_signal(
-                f"{self.unique_id}_{SIGNAL_ATTR_UPDATED}",
-                attrid,
-                self.cluster.attributes.get(attrid, [attrid])[0],
-                value,
+                self._signal_attr_updated, attrid, self._attr_name(attrid), value
             )
             return
-        attr_name = self.cluster.attributes.get(attrid, [attrid])[0]
-        self.async_send_signal(
-            f"{self.unique_id}_{SIGNAL_STATE_ATTR}", attr_name, value
-        )
+        self.async_send_signal(self._signal_state_attr, self._attr_name(attrid), value)
 
     async def async_initialize(self, from_cache):
         """Initialize channel."""
         await self.async_read_state(from_cache)
-        await super().async_initialize(from_cache)
+        # reported attributes were just read in the same request, use the cache
+        await super().async_initialize(True)
 
     async def async_update(self):
         """Retrieve latest state."""
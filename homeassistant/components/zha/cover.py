@@ -216,8 +216,10 @@ class Shade(ZhaEntity, CoverEntity):
         self.async_accept_signal(
             self._on_off_channel, SIGNAL_ATTR_UPDATED, self.async_set_open_closed
         )
-        self.async_accept_signal(
-            self._level_channel, SIGNAL_SET_LEVEL, self.async_set_level
+        self._unsubs.append(
+            self._level_channel.register_level_listener(
+                SIGNAL_SET_LEVEL, self.async_set_level
+            )
         )
 
     @callback
@@ -230,14 +232,20 @@ class Shade(ZhaEntity, CoverEntity):
     @callback
     def async_set_open_closed(self, attr_id: int, attr_name: str, value: bool) -> None:
         """Set open/closed state."""
-        self._is_open = bool(value)
+        is_open = bool(value)
+        if is_open == self._is_open:
+            return
+        self._is_open = is_open
         self.async_write_ha_state()
 
     @callback
     def async_set_level(self, value: int) -> None:
         """Set the reported position."""
         value = max(0, min(255, value))
-        self._position = int(value * 100 / 255)
+        position = int(value * 100 / 255)
+        if position == self._position:
+            return
+        self._position = position
         self.async_write_ha_state()
 
     async def async_open_cover(self, **kwargs):
@@ -153,6 +153,7 @@ class BaseLight(LogMixin, light.LightEntity):
         """Return the warmest color_temp that this light supports."""
         return self._max_mireds
 
+    @callback
     def set_level(self, value):
         """Set the brightness of this light between 0..254.
 
@@ -161,6 +162,8 @@ class BaseLight(LogMixin, light.LightEntity):
         level
         """
         value = max(0, min(254, value))
+        if value == self._brightness:
+            return
         self._brightness = value
         self.async_write_ha_state()
 
@@ -226,6 +229,7 @@ class BaseLight(LogMixin, light.LightEntity):
             t_log["on_off"] = result
             if not isinstance(result, list) or result[1] is not Status.SUCCESS:
                 self.debug("turned on: %s", t_log)
+                self.async_write_ha_state()
                 return
             self._state = True
         if (
@@ -237,6 +241,7 @@ class BaseLight(LogMixin, light.LightEntity):
             t_log["move_to_color_temp"] = result
             if not isinstance(result, list) or result[1] is not Status.SUCCESS:
                 self.debug("turned on: %s", t_log)
+                self.async_write_ha_state()
                 return
             self._color_temp = temperature
 
@@ -252,6 +257,7 @@ class BaseLight(LogMixin, light.LightEntity):
             t_log["move_to_color"] = result
             if not isinstance(result, list) or result[1] is not Status.SUCCESS:
                 self.debug("turned on: %s", t_log)
+                self.async_write_ha_state()
                 return
             self._hs_color = hs_color
 
@@ -364,8 +370,11 @@ class Light(BaseLight, ZhaEntity):
     @callback
     def async_set_state(self, attr_id, attr_name, value):
         """Set the state."""
-        self._state = bool(value)
-        if value:
+        state = bool(value)
+        if state == self._state:
+            return
+        self._state = state
+        if state:
             self._off_brightness = None
         self.async_write_ha_state()
 
@@ -376,8 +385,10 @@ class Light(BaseLight, ZhaEntity):
             self._on_off_channel, SIGNAL_ATTR_UPDATED, self.async_set_state
         )
         if self._level_channel:
-            self.async_accept_signal(
-                self._level_channel, SIGNAL_SET_LEVEL, self.set_level
+            self._unsubs.append(
+                self._level_channel.register_level_listener(
+                    SIGNAL_SET_LEVEL, self.set_level
+                )
             )
         refresh_interval = random.randint(*[x * 60 for x in self._REFRESH_INTERVAL])
         self._cancel_refresh_handle = async_track_time_interval(
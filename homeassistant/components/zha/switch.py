@@ -86,7 +86,10 @@ class Switch(BaseSwitch, ZhaEntity):
     @callback
     def async_set_state(self, attr_id: int, attr_name: str, value: Any):
         """Handle state update from channel."""
-        self._state = bool(value)
+        state = bool(value)
+        if state == self._state:
+            return
+        self._state = state
         self.async_write_ha_state()
 
     async def async_added_to_hass(self) -> None:
@@ -61,6 +61,38 @@ def poll_control_ch(channel_pool, zigpy_device_mock):
     return channel_class(cluster, channel_pool)
 
 
+def _make_channel(channel_pool, zigpy_device_mock, cluster_id, patch_cluster=True):
+    """Create a channel for a single cluster device."""
+    zigpy_dev = zigpy_device_mock(
+        {1: {"in_clusters": [cluster_id], "out_clusters": [], "device_type": 0x1234}},
+        patch_cluster=patch_cluster,
+    )
+    cluster = zigpy_dev.endpoints[1].in_clusters[cluster_id]
+    channel_class = registries.ZIGBEE_CHANNEL_REGISTRY.get(cluster_id)
+    return channel_class(cluster, channel_pool)
+
+
+@pytest.fixture
+def power_config_ch(channel_pool, zigpy_device_mock):
+    """Power configuration channel fixture with an unpatched cluster."""
+    cluster_id = zigpy.zcl.clusters.general.PowerConfiguration.cluster_id
+    return _make_channel(channel_pool, zigpy_device_mock, cluster_id, False)
+
+
+@pytest.fixture
+def on_off_ch(channel_pool, zigpy_device_mock):
+    """On/off channel fixture."""
+    cluster_id = zigpy.zcl.clusters.general.OnOff.cluster_id
+    return _make_channel(channel_pool, zigpy_device_mock, cluster_id)
+
+
+@pytest.fixture
+def level_ch(channel_pool, zigpy_device_mock):
+    """Level control channel fixture."""
+    cluster_id = zigpy.zcl.clusters.general.LevelControl.cluster_id
+    return _make_channel(channel_pool, zigpy_device_mock, cluster_id)
+
+
 @pytest.fixture
 async def poll_control_device(zha_device_restored, zigpy_device_mock):
     """Poll control device fixture."""
@@ -424,6 +456,13 @@ async def test_poll_control_configure(poll_control_ch):
     }
 
 
+async def test_poll_control_configure_unchanged(poll_control_ch):
+    """Test poll control channel skips writing an unchanged check-in interval."""
+    poll_control_ch.cluster._attr_cache[0x0000] = poll_control_ch.CHECKIN_INTERVAL
+    await poll_control_ch.async_configure()
+    assert poll_control_ch.cluster.write_attributes.call_count == 0
+
+
 async def test_poll_control_checkin_response(poll_control_ch):
     """Test poll control channel checkin response."""
     rsp_mock = tests.async_mock.AsyncMock()
@@ -475,3 +514,86 @@ async def test_poll_control_cluster_command(hass, poll_control_device):
     assert data["args"][1] is mock.sentinel.args2
     assert data["args"][2] is mock.sentinel.args3
     assert data["unique_id"] == "00:11:22:33:44:55:66:77:1:0x0020"
+
+
+async def test_power_config_initialize(power_config_ch):
+    """Test power configuration channel reads its attributes in one request."""
+    cluster = power_config_ch.cluster
+
+    def _read_attributes_raw(attr_ids, manufacturer=None):
+        for attr_id in attr_ids:
+            cluster._attr_cache[attr_id] = 1
+        return [[]]
+
+    cluster.read_attributes_raw = tests.async_mock.AsyncMock(
+        side_effect=_read_attributes_raw
+    )
+
+    await power_config_ch.async_initialize(False)
+    assert cluster.read_attributes_raw.await_count == 1
+    assert len(cluster.read_attributes_raw.await_args[0][0]) == 4
+
+
+async def test_on_with_timed_off_coalesced(hass, channel_pool, on_off_ch):
+    """Test repeated on_with_timed_off commands reuse the pending off timer."""
+    channel_pool.hass = hass
+    cmd_id = 0x42  # on_with_timed_off
+
+    on_off_ch.cluster_command(1, cmd_id, [0, 600, 0])
+    off_listener = on_off_ch._off_listener
+    assert off_listener is not None
+
+    on_off_ch.cluster_command(2, cmd_id, [0, 600, 0])
+    assert on_off_ch._off_listener is off_listener
+
+    on_off_ch.cluster_command(3, cmd_id, [0, 1200, 0])
+    assert on_off_ch._off_listener is not off_listener
+    assert off_listener.cancelled()
+
+    on_off_ch.cluster_command(4, cmd_id, [0, 0, 0])
+    assert on_off_ch._off_listener is None
+
+
+def test_level_listener(channel_pool, level_ch):
+    """Test level changes are delivered to a registered listener."""
+    listener = mock.MagicMock()
+
+    remove_listener = level_ch.register_level_listener(
+        zha_const.SIGNAL_SET_LEVEL, listener
+    )
+    level_ch.attribute_updated(level_ch.CURRENT_LEVEL, 100)
+    assert listener.call_args == mock.call(100)
+    assert channel_pool.async_send_signal.call_count == 0
+
+    level_ch.dispatch_level_change(zha_const.SIGNAL_MOVE_LEVEL, 10)
+    assert listener.call_count == 1
+    assert channel_pool.async_send_signal.call_count == 1
+
+    other_listener = mock.MagicMock()
+    with mock.patch.object(level_ch, "warning") as warning:
+        remove_other = level_ch.register_level_listener(
+            zha_const.SIGNAL_SET_LEVEL, other_listener
+        )
+    assert warning.call_count == 1
+    level_ch.attribute_updated(level_ch.CURRENT_LEVEL, 75)
+    assert listener.call_count == 1
+    assert other_listener.call_args == mock.call(75)
+
+    # removing the replaced listener keeps the current one registered
+    remove_listener()
+    level_ch.attribute_updated(level_ch.CURRENT_LEVEL, 50)
+    assert other_listener.call_count == 2
+
+    remove_other()
+    level_ch.attribute_updated(level_ch.CURRENT_LEVEL, 25)
+    assert other_listener.call_count == 2
+    assert channel_pool.async_send_signal.call_count == 2
+
+
+async def test_level_control_initialize(level_ch):
+    """Test level control channel reads current_level once on initialization."""
+    cluster = level_ch.cluster
+
+    await level_ch.async_initialize(False)
+    assert cluster.read_attributes.await_count == 1
+    assert cluster.read_attributes.await_args[0][0] == ["current_level"]
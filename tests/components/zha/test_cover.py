@@ -16,6 +16,7 @@ from homeassistant.components.cover import (
     SERVICE_SET_COVER_POSITION,
     SERVICE_STOP_COVER,
 )
+from homeassistant.components.zha.cover import Shade
 from homeassistant.const import (
     ATTR_COMMAND,
     STATE_CLOSED,
@@ -325,6 +326,34 @@ async def test_shade(hass, zha_device_joined_restored, zigpy_shade_device):
         assert cluster_level.request.call_args[0][1] in (0x0003, 0x0007)
 
 
+async def test_shade_duplicate_report(hass, zha_device_joined, zigpy_shade_device):
+    """Test duplicate reports do not write the shade state again."""
+    zha_device = await zha_device_joined(zigpy_shade_device)
+    cluster_on_off = zigpy_shade_device.endpoints.get(1).on_off
+    cluster_level = zigpy_shade_device.endpoints.get(1).level
+    entity_id = await find_entity_id(DOMAIN, zha_device, hass)
+    await async_enable_traffic(hass, [zha_device])
+
+    with patch.object(
+        Shade,
+        "async_write_ha_state",
+        autospec=True,
+        side_effect=Shade.async_write_ha_state,
+    ) as write_state:
+        await send_attributes_report(hass, cluster_on_off, {0: True})
+        await send_attributes_report(hass, cluster_level, {0: 0})
+        await send_attributes_report(hass, cluster_level, {0: 255})
+        state = hass.states.get(entity_id)
+        assert state.state == STATE_OPEN
+        assert state.attributes[ATTR_CURRENT_POSITION] == 100
+        assert write_state.call_count == 3
+
+        await send_attributes_report(hass, cluster_on_off, {0: True})
+        await send_attributes_report(hass, cluster_level, {0: 255})
+        assert write_state.call_count == 3
+        assert hass.states.get(entity_id).last_updated == state.last_updated
+
+
 async def test_restore_state(hass, zha_device_restored, zigpy_shade_device):
     """Ensure states are restored on startup."""
 
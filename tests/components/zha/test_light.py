@@ -10,7 +10,7 @@ import zigpy.zcl.foundation as zcl_f
 
 from homeassistant.components.light import DOMAIN, FLASH_LONG, FLASH_SHORT
 from homeassistant.components.zha.core.group import GroupMember
-from homeassistant.components.zha.light import FLASH_EFFECTS
+from homeassistant.components.zha.light import FLASH_EFFECTS, Light
 from homeassistant.const import STATE_OFF, STATE_ON, STATE_UNAVAILABLE
 import homeassistant.util.dt as dt_util
 
@@ -292,6 +292,76 @@ async def test_light(
         await async_test_flash_from_hass(hass, cluster_identify, entity_id, FLASH_LONG)
 
 
+async def test_light_duplicate_report(hass, zigpy_device_mock, zha_device_joined):
+    """Test duplicate reports do not write the light state again."""
+    zigpy_device = zigpy_device_mock(LIGHT_LEVEL)
+    zha_device = await zha_device_joined(zigpy_device)
+    entity_id = await find_entity_id(DOMAIN, zha_device, hass)
+    cluster_on_off = zigpy_device.endpoints[1].on_off
+    cluster_level = zigpy_device.endpoints[1].level
+    await async_enable_traffic(hass, [zha_device])
+
+    with patch.object(
+        Light,
+        "async_write_ha_state",
+        autospec=True,
+        side_effect=Light.async_write_ha_state,
+    ) as write_state:
+        await send_attributes_report(hass, cluster_on_off, {0: 1})
+        await send_attributes_report(hass, cluster_level, {0: 100})
+        state = hass.states.get(entity_id)
+        assert state.state == STATE_ON
+        assert state.attributes["brightness"] == 100
+        assert write_state.call_count == 2
+
+        await send_attributes_report(hass, cluster_on_off, {0: 1})
+        await send_attributes_report(hass, cluster_level, {0: 100})
+        assert write_state.call_count == 2
+        assert hass.states.get(entity_id).last_updated == state.last_updated
+
+
+@patch(
+    "zigpy.zcl.clusters.lighting.Color.request",
+    new=AsyncMock(return_value=[sentinel.data, zcl_f.Status.FAILURE]),
+)
+@patch(
+    "zigpy.zcl.clusters.general.LevelControl.request",
+    new=AsyncMock(return_value=[sentinel.data, zcl_f.Status.SUCCESS]),
+)
+@patch(
+    "zigpy.zcl.clusters.general.OnOff.request",
+    new=AsyncMock(return_value=[sentinel.data, zcl_f.Status.SUCCESS]),
+)
+async def test_light_turn_on_partial_failure(
+    hass, zigpy_device_mock, zha_device_joined
+):
+    """Test the light state is written when a later turn on command fails."""
+    zigpy_device = zigpy_device_mock(LIGHT_COLOR)
+    zha_device = await zha_device_joined(zigpy_device)
+    entity_id = await find_entity_id(DOMAIN, zha_device, hass)
+    cluster_on_off = zigpy_device.endpoints[1].on_off
+    cluster_level = zigpy_device.endpoints[1].level
+    await async_enable_traffic(hass, [zha_device])
+    assert hass.states.get(entity_id).state == STATE_OFF
+
+    await hass.services.async_call(
+        DOMAIN,
+        "turn_on",
+        {"entity_id": entity_id, "brightness": 100, "hs_color": (30, 50)},
+        blocking=True,
+    )
+    state = hass.states.get(entity_id)
+    assert state.state == STATE_ON
+    assert state.attributes["brightness"] == 100
+
+    # the device confirms the commands that succeeded
+    await send_attributes_report(hass, cluster_on_off, {0: 1})
+    await send_attributes_report(hass, cluster_level, {0: 100})
+    state = hass.states.get(entity_id)
+    assert state.state == STATE_ON
+    assert state.attributes["brightness"] == 100
+
+
 async def async_test_on_off_from_light(hass, cluster, entity_id):
     """Test on off functionality from the light."""
     # turn on at light
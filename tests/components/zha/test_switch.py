@@ -7,6 +7,7 @@ import zigpy.zcl.clusters.general as general
 import zigpy.zcl.foundation as zcl_f
 
 from homeassistant.components.switch import DOMAIN
+from homeassistant.components.zha.switch import Switch
 from homeassistant.const import STATE_OFF, STATE_ON, STATE_UNAVAILABLE
 
 from .common import (
@@ -157,6 +158,42 @@ async def test_switch(hass, zha_device_joined_restored, zigpy_device):
     await async_test_rejoin(hass, zigpy_device, [cluster], (1,))
 
 
+async def test_switch_duplicate_report(hass, zha_device_joined, zigpy_device):
+    """Test a duplicate report does not write the switch state again."""
+    zha_device = await zha_device_joined(zigpy_device)
+    cluster = zigpy_device.endpoints.get(1).on_off
+    entity_id = await find_entity_id(DOMAIN, zha_device, hass)
+    await async_enable_traffic(hass, [zha_device])
+
+    with patch.object(
+        Switch,
+        "async_write_ha_state",
+        autospec=True,
+        side_effect=Switch.async_write_ha_state,
+    ) as write_state:
+        await send_attributes_report(hass, cluster, {0: 1})
+        assert hass.states.get(entity_id).state == STATE_ON
+        assert write_state.call_count == 1
+        last_updated = hass.states.get(entity_id).last_updated
+
+        await send_attributes_report(hass, cluster, {0: 1})
+        assert write_state.call_count == 1
+        assert hass.states.get(entity_id).last_updated == last_updated
+
+        with patch(
+            "zigpy.zcl.Cluster.request",
+            return_value=mock_coro([0x01, zcl_f.Status.SUCCESS]),
+        ):
+            await hass.services.async_call(
+                DOMAIN, "turn_off", {"entity_id": entity_id}, blocking=True
+            )
+        assert hass.states.get(entity_id).state == STATE_OFF
+
+        # the "off" report was lost and the switch is turned on again at the device
+        await send_attributes_report(hass, cluster, {0: 1})
+        assert hass.states.get(entity_id).state == STATE_ON
+
+
 async def async_test_zha_group_switch_entity(
     hass, device_switch_1, device_switch_2, coordinator
 ):